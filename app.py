@@ -18,12 +18,19 @@
 # - Keeps debug expander for request URL + result counts
 # - Keeps optional NY facet + search mode selector
 
+import gzip
+import hashlib
+import importlib.util
 import json
+import os
+import threading
 import urllib.parse
-import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import requests
 import streamlit as st
 
 __version__ = "0.8.5"
@@ -31,10 +38,11 @@ __version__ = "0.8.5"
 # -----------------------------
 # Optional Supabase
 # -----------------------------
+# Only probe for the package here: supabase (and httpx/postgrest under it) is imported the
+# first time a client is built, so sessions without credentials never load it.
 SUPABASE_ENABLED = False
 try:
-    from supabase import create_client  # type: ignore
-    SUPABASE_ENABLED = True
+    SUPABASE_ENABLED = importlib.util.find_spec("supabase") is not None
 except Exception:
     SUPABASE_ENABLED = False
 
@@ -59,6 +67,7 @@ def inject_css():
         .season-card {
           background: rgba(255,255,255,0.95);
           border: 1px solid rgba(12,35,64,0.18);
+          border-left: 8px solid var(--era-color, rgba(12,35,64,0.35));
           border-radius: 14px;
           padding: 14px;
           margin-bottom: 10px;
@@ -100,15 +109,14 @@ def inject_css():
         .era-title { font-weight: 900; letter-spacing: 0.2px; }
         .era-years { color: rgba(17,24,39,0.65); font-size: 0.9rem; margin-top: 2px; }
 
-        /* Era-specific subtle left borders */
-        .season-era-pre  { border-left: 8px solid rgba(12,35,64,0.35); }
-        .season-era-ruth { border-left: 8px solid rgba(12,35,64,0.55); }
-        .season-era-dim  { border-left: 8px solid rgba(12,35,64,0.48); }
-        .season-era-mant { border-left: 8px solid rgba(12,35,64,0.40); }
-        .season-era-zoo  { border-left: 8px solid rgba(12,35,64,0.32); }
-        .season-era-lean { border-left: 8px solid rgba(12,35,64,0.26); }
-        .season-era-core { border-left: 8px solid rgba(12,35,64,0.52); }
-        .season-era-mod  { border-left: 8px solid rgba(12,35,64,0.34); }
+        /* Era-specific subtle left borders: one shared rule above, one color per era */
+        .season-card[data-era="ruth"] { --era-color: rgba(12,35,64,0.55); }
+        .season-card[data-era="dim"]  { --era-color: rgba(12,35,64,0.48); }
+        .season-card[data-era="mant"] { --era-color: rgba(12,35,64,0.40); }
+        .season-card[data-era="zoo"]  { --era-color: rgba(12,35,64,0.32); }
+        .season-card[data-era="lean"] { --era-color: rgba(12,35,64,0.26); }
+        .season-card[data-era="core"] { --era-color: rgba(12,35,64,0.52); }
+        .season-card[data-era="mod"]  { --era-color: rgba(12,35,64,0.34); }
 
         .small-note { color: rgba(17,24,39,0.65); font-size: 0.9rem; }
         </style>
@@ -146,110 +154,238 @@ ERAS = [
 ]
 
 
-def era_for_year(year: int) -> dict:
-    for key, label, start, end, css in ERAS:
-        if start <= year <= end:
-            return {"key": key, "label": label, "start": start, "end": end, "css": css}
+ERA_META = [{"key": k, "label": label, "start": a, "end": b, "css": css} for k, label, a, b, css in ERAS]
+ERA_STARTS = np.array([e[2] for e in ERAS])
+ERA_ENDS = np.array([e[3] for e in ERAS])
+
+
+def era_index(years):
+    # Vectorized era lookup: position in ERAS, or -1 for seasons between the bands
+    idx = np.searchsorted(ERA_STARTS, years, side="right") - 1
+    inside = (idx >= 0) & (years <= ERA_ENDS[np.maximum(idx, 0)])
+    return np.where(inside, idx, -1)
+
+
+def era_meta(idx: int, year: int) -> dict:
+    if idx >= 0:
+        return ERA_META[idx]
     return {"key": "pre", "label": "Other Years", "start": year, "end": year, "css": "pre"}
 
 
-def render_era_header(era: dict):
+def era_for_year(year: int) -> dict:
+    return era_meta(int(era_index(year)), year)
+
+
+def era_header_html(era: dict) -> str:
     years = f"{era['start']}–{era['end']}" if era["start"] != era["end"] else f"{era['start']}"
-    st.markdown(
-        f"""
-        <div class="era-band">
-          <div class="era-title">{era['label']}</div>
-          <div class="era-years">{years}</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
+    return (
+        f"<div class='era-band'><div class='era-title'>{era['label']}</div>"
+        f"<div class='era-years'>{years}</div></div>"
     )
 
 
+# The defined bands' headers never change: format them once at import
+ERA_HEADER_HTML = [era_header_html(era) for era in ERA_META]
+
+
 # -----------------------------
 # Data loading
 # -----------------------------
-@st.cache_data(show_spinner=False)
-def load_data(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+TEAMS_CSV = "Teams.csv"
+
+# The only Lahman columns the app reads (of ~48), with compact dtypes. Low-cardinality codes
+# are categories, so == "NYA" / == "Y" compare integer codes. The ints are nullable so a blank
+# cell shows as "—" for that season instead of failing the whole load.
+TEAMS_DTYPES = {
+    "yearID": "Int16",
+    "teamID": "category",
+    "W": "Int16",
+    "L": "Int16",
+    "DivWin": "category",
+    "WCWin": "category",
+    "LgWin": "category",
+    "WSWin": "category",
+}
+FLAG_COLS = ["DivWin", "WCWin", "LgWin", "WSWin"]
+
+
+def _read_teams(path: str) -> pd.DataFrame:
+    # Parquet sidecar (typed, columnar) so cold starts skip the CSV tokenizer. It is only used
+    # for the exact CSV it was built from (size + mtime_ns kept in its schema metadata), so a
+    # CSV swapped for an older copy is reparsed too; any parquet problem just falls back to CSV.
+    pq_path = os.path.splitext(path)[0] + ".parquet"
+    src = os.stat(path)
+    source_tag = f"{src.st_size}:{src.st_mtime_ns}".encode()
+    try:
+        import pyarrow.parquet as pq
+
+        if (pq.read_schema(pq_path).metadata or {}).get(b"teams_csv") == source_tag:
+            return pd.read_parquet(pq_path, columns=list(TEAMS_DTYPES)).astype(TEAMS_DTYPES)
+    except Exception:
+        pass
+
+    # pyarrow's multithreaded tokenizer when it is installed (it also backs the sidecar)
+    try:
+        df = pd.read_csv(path, usecols=list(TEAMS_DTYPES), dtype=TEAMS_DTYPES, engine="pyarrow")
+    except ImportError:
+        df = pd.read_csv(path, usecols=list(TEAMS_DTYPES), dtype=TEAMS_DTYPES)
+
+    # Written to a per-writer temp file and renamed, so concurrent cold starts never read half a file
+    tmp = f"{pq_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
 
-    if "yearID" in df.columns:
-        df["yearID"] = pd.to_numeric(df["yearID"], errors="coerce")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"teams_csv": source_tag})
+        pq.write_table(table, tmp)
+        os.replace(tmp, pq_path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+    return df
+
+
+# mtime is only part of the cache key: editing Teams.csv invalidates the cached frame
+# without needing a server restart.
+@st.cache_data(show_spinner=False)
+def load_data(path: str, mtime: float) -> pd.DataFrame:
+    # Drop other franchises straight after parsing: everything below, and the cached copy,
+    # then works on ~120 seasons instead of ~3,600 team-seasons.
+    df = _read_teams(path)
+    df = df[df["teamID"] == "NYA"].copy()
 
-    for col in ["DivWin", "WCWin", "LgWin", "WSWin"]:
-        if col in df.columns:
-            df[col] = df[col].fillna("")
+    for col in FLAG_COLS:
+        if "" not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories("")
+        df[col] = df[col].fillna("")
 
-    if "W" in df.columns and "L" in df.columns:
-        w = pd.to_numeric(df["W"], errors="coerce")
-        l = pd.to_numeric(df["L"], errors="coerce")
-        df["win_pct"] = (w / (w + l)).round(3)
+    df["win_pct"] = (df["W"] / (df["W"] + df["L"])).round(3).astype("float64")  # NA -> NaN
 
     return df
 
 
+POSTSEASON_TAGS = [("WCWin", "WC"), ("DivWin", "DIV"), ("LgWin", "AL"), ("WSWin", "WS")]
+# Every WC/DIV/AL/WS combination, indexed by a 4-bit code (WC is the high bit)
+POSTSEASON_LABELS = np.array(
+    [
+        " · ".join(tag for i, (_, tag) in enumerate(POSTSEASON_TAGS) if code >> (3 - i) & 1) or "—"
+        for code in range(16)
+    ],
+    dtype=object,
+)
+
+
+# Takes load_data's frame, which is already the NYA rows only
 def get_yankees(df: pd.DataFrame) -> pd.DataFrame:
-    if "teamID" not in df.columns:
-        return pd.DataFrame()
+    if df.empty:
+        return df.copy()
+
+    # No defensive .copy(): dropna, sort_values and set_index each already return a new frame
+    yank = df.dropna(subset=["yearID"]).sort_values("yearID", ascending=False)
+    yank["yearID"] = yank["yearID"].astype("int16")
+    # Index by season so the details pane can look a year up directly instead of scanning
+    yank = yank.set_index(yank["yearID"].astype(int).rename("year"))
+
+    # Column-wise, no per-row Python: "W-L" where both are known, else "—"
+    w, l = yank["W"], yank["L"]
+    yank["record"] = (w.astype(str) + "-" + l.astype(str)).where(w.notna() & l.notna(), "—")
+
+    # 0/1 copies of the Y/N flags: ring counts, the WS filter and the 4-bit code work on int8
+    for col in FLAG_COLS:
+        yank[f"{col}_int"] = yank[col].eq("Y").astype("int8")
+
+    # "WC · DIV · AL · WS": pack the four flags into a 4-bit code and gather the label
+    code = np.zeros(len(yank), dtype=np.uint8)
+    for col, _ in POSTSEASON_TAGS:
+        code <<= 1
+        code |= yank[f"{col}_int"].to_numpy(np.uint8)
+    yank["postseason"] = POSTSEASON_LABELS[code]
+    yank["pills"] = PILLS_HTML[code]
+
+    # Card-ready win % text, formatted once here instead of a pd.notna check per card
+    wp = yank["win_pct"].to_numpy(dtype=np.float64)
+    yank["win_pct_str"] = np.where(np.isnan(wp), "—", np.char.mod("%.3f", wp)).astype(object)
+
+    yank["era"] = era_index(yank["yearID"].to_numpy()).astype("int8")
+    yank["decade"] = (yank["yearID"] // 10 * 10).astype("int16")
+    return yank
 
-    yank = df[df["teamID"] == "NYA"].copy()
-    if yank.empty:
-        return yank
 
-    yank = yank.dropna(subset=["yearID"]).sort_values("yearID", ascending=False)
+# The derived Yankees frame is what every rerun actually uses, so cache it on the same
+# (path, mtime) key instead of re-filtering and re-deriving from the full Teams frame.
+@st.cache_data(show_spinner=False)
+def load_yankees(path: str, mtime: float) -> pd.DataFrame:
+    return get_yankees(load_data(path, mtime))
 
-    yank["record"] = yank.apply(
-        lambda r: f"{int(r['W'])}-{int(r['L'])}"
-        if pd.notna(r.get("W")) and pd.notna(r.get("L"))
-        else "—",
-        axis=1,
-    )
 
-    def postseason(r):
-        flags = []
-        if r.get("WCWin") == "Y":
-            flags.append("WC")
-        if r.get("DivWin") == "Y":
-            flags.append("DIV")
-        if r.get("LgWin") == "Y":
-            flags.append("AL")
-        if r.get("WSWin") == "Y":
-            flags.append("WS")
-        return " · ".join(flags) if flags else "—"
-
-    yank["postseason"] = yank.apply(postseason, axis=1)
-    return yank
+# Filter-independent numbers (slider bounds, decade options, total rings): computed once per
+# data file instead of on every rerun.
+@st.cache_data(show_spinner=False)
+def yankees_overview(path: str, mtime: float) -> Dict[str, Any]:
+    yank = load_yankees(path, mtime)
+    years = yank.index
+    return {
+        "min_year": int(years.min()),
+        "max_year": int(years.max()),
+        "decades": sorted(yank["decade"].unique().tolist()),
+        "rings": ws_rings_count(yank),
+    }
 
 
 # -----------------------------
 # Supabase helpers
 # -----------------------------
+@st.cache_resource(show_spinner=False)
+def _supabase_client(url: str, key: str):
+    # One client (and its pooled HTTP connections) per credentials, shared across reruns/sessions.
+    from supabase import create_client  # type: ignore
+
+    return create_client(url, key)
+
+
+def supabase_credentials() -> tuple[str, str]:
+    return st.secrets.get("SUPABASE_URL", "").strip(), st.secrets.get("SUPABASE_KEY", "").strip()
+
+
 def get_supabase():
     if not SUPABASE_ENABLED:
         return None
-    url = st.secrets.get("SUPABASE_URL", "").strip()
-    key = st.secrets.get("SUPABASE_KEY", "").strip()
+    url, key = supabase_credentials()
     if not url or not key:
         return None
     try:
-        return create_client(url, key)
-    except Exception:
+        return _supabase_client(url, key)
+    except ImportError as e:
+        # find_spec only proves the package is present; the real import can still fail
+        st.sidebar.warning(f"Supabase is installed but failed to import: {e}")
+        return None
+    except Exception as e:
+        st.sidebar.error(f"Could not create Supabase client: {e}")
         return None
 
 
+FLAG_COLUMNS = "year,is_read,is_favorite,notes"
+
+
+# Shared by every session for the same user; save_flag() clears it so writes show up immediately.
+# The leading underscore keeps the client object out of Streamlit's cache key.
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_flags(_sb, user_id: str) -> dict[int, dict]:
+    # Only the columns the UI reads: a narrower PostgREST payload to transfer, parse and cache.
+    # The {year: row} dict is built here too, so a cache hit skips the rebuild. year is part of
+    # the (user_id, year) upsert key, so every row has one: no per-row try/except needed.
+    resp = _sb.table("user_season_flags").select(FLAG_COLUMNS).eq("user_id", user_id).execute()
+    return {int(r["year"]): r for r in resp.data or []}
+
+
 def read_flags(sb, user_id: str) -> dict[int, dict]:
     if sb is None:
         return {}
     try:
-        resp = sb.table("user_season_flags").select("*").eq("user_id", user_id).execute()
-        data = resp.data or []
-        out: dict[int, dict] = {}
-        for r in data:
-            try:
-                out[int(r["year"])] = r
-            except Exception:
-                continue
-        return out
+        return _fetch_flags(sb, user_id)
     except Exception as e:
         if "PGRST205" in str(e) or "Could not find the table" in str(e):
             st.sidebar.warning("Supabase table `user_season_flags` not found yet. Create it to enable saving flags.")
@@ -271,6 +407,7 @@ def save_flag(sb, user_id: str, year: int, read: bool, fav: bool, notes: str):
         },
         on_conflict="user_id,year",
     ).execute()
+    _fetch_flags.clear()
 
 
 # -----------------------------
@@ -308,21 +445,27 @@ TEAM_TERMS_PRE1913 = ["highlanders", "new york highlanders", "n.y. highlanders"]
 TEAM_TERMS_POST1912 = ["yankees", "new york yankees", "n.y. yankees"]
 
 
-def _fetch_json(url: str, timeout_sec: int = 15) -> Dict[str, Any]:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (compatible; YankeesHistoryDashboard/0.8.5)",
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    # Shared keep-alive session: repeat loc.gov requests reuse the pooled TCP/TLS connection.
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": f"Mozilla/5.0 (compatible; YankeesHistoryDashboard/{__version__})",
             "Accept": "application/json,text/javascript,*/*;q=0.1",
-        },
+        }
     )
+    return session
+
+
+def _fetch_json(url: str, timeout_sec: int = 15) -> Dict[str, Any]:
     try:
-        with urllib.request.urlopen(req, timeout=timeout_sec) as resp:
-            status = getattr(resp, "status", None) or resp.getcode()
-            ctype = (resp.headers.get("Content-Type") or "").lower()
-            raw = resp.read()
+        resp = _http_session().get(url, timeout=timeout_sec)
+        resp.raise_for_status()
+        status = resp.status_code
+        ctype = (resp.headers.get("Content-Type") or "").lower()
 
-        text = raw.decode("utf-8", errors="replace").strip()
+        text = resp.content.decode("utf-8", errors="replace").strip()
         if not text:
             raise RuntimeError(f"Empty response (HTTP {status}).")
 
@@ -337,7 +480,110 @@ def _fetch_json(url: str, timeout_sec: int = 15) -> Dict[str, Any]:
         raise RuntimeError(f"Article fetch failed: {e}") from e
 
 
-@st.cache_data(show_spinner=False)
+CHRONAM_CACHE_DIR = os.path.join(".cache", "chronam")
+# Disk-layer bound: past this many responses the least recently used files are evicted
+CHRONAM_CACHE_MAX_FILES = 2000
+
+# The only result fields the panel reads; loc.gov items also carry large unused arrays
+# (image_url, partof, subject, ...), so both cache layers keep just these.
+ARTICLE_FIELDS = ("title", "date", "url", "aka", "item_url", "snippet", "description")
+
+
+def _slim_chronam(data: Dict[str, Any]) -> Dict[str, Any]:
+    results = data.get("results") if isinstance(data.get("results"), list) else []
+    pag = data.get("pagination")
+    return {
+        "results": [{k: it[k] for k in ARTICLE_FIELDS if k in it} for it in results if isinstance(it, dict)],
+        "pagination": {"total": pag.get("total")} if isinstance(pag, dict) else {},
+    }
+
+
+def _chronam_cache_path(url: str) -> str:
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(CHRONAM_CACHE_DIR, f"{key}.json.gz")
+
+
+def _prune_chronam_cache(max_files: int = CHRONAM_CACHE_MAX_FILES):
+    # Cache hits refresh their mtime, so oldest-mtime-first is least-recently-used-first
+    entries = []
+    with os.scandir(CHRONAM_CACHE_DIR) as it:
+        for e in it:
+            if e.name.endswith(".json.gz"):
+                try:
+                    entries.append((e.stat().st_mtime, e.path))
+                except OSError:
+                    pass
+    if len(entries) <= max_files:
+        return
+    entries.sort()
+    for _, p in entries[: len(entries) - max_files]:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+
+
+def _cached_fetch_json(url: str) -> Dict[str, Any]:
+    # L2 under st.cache_data: gzipped responses on disk survive restarts/redeploys.
+    # The cache is best-effort; any disk problem falls back to the network.
+    path = _chronam_cache_path(url)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+    except Exception:
+        pass
+
+    data = _slim_chronam(_fetch_json(url))
+    # Sessions and prefetch workers are threads of one process: each writer gets its own temp file
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CHRONAM_CACHE_DIR, exist_ok=True)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+        _prune_chronam_cache()
+    except Exception:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+    return data
+
+
+# Same parameter order and quoting as urlencode(); the URL is also the disk-cache key, so it
+# must stay byte-stable.
+CHRONAM_URL_TMPL = (
+    CHRONAM_BASE + "?fo=json&c={rows}&qs={qs}&ops={ops}&start_date={y}-01-01&end_date={y}-12-31&dl=page{state}"
+)
+
+
+def chronam_request_url(
+    year: int,
+    query: str,
+    rows: int = 20,
+    ops: str = "~10",
+    state: str | None = None,
+) -> str:
+    rows = max(1, min(int(rows), 50))
+    ops = (ops or "~10").strip().upper()
+    quote = urllib.parse.quote_plus
+    return CHRONAM_URL_TMPL.format(
+        rows=rows,
+        qs=quote(query),
+        ops=quote(ops),
+        y=year,
+        state=f"&location_state={quote(state)}" if state else "",
+    )
+
+
+# Bounded: every distinct (year, query, rows, ops, state) is an entry; the disk layer keeps
+# more (up to CHRONAM_CACHE_MAX_FILES) across restarts
+@st.cache_data(show_spinner=False, max_entries=500)
 def chronam_search_locgov(
     year: int,
     query: str,
@@ -349,23 +595,10 @@ def chronam_search_locgov(
     if not query:
         return {"results": [], "total": 0, "request_url": ""}
 
-    rows = max(1, min(int(rows), 50))
-    ops = (ops or "~10").strip().upper()
-
-    params = {
-        "fo": "json",
-        "c": str(rows),
-        "qs": query,
-        "ops": ops,
-        "start_date": f"{year}-01-01",
-        "end_date": f"{year}-12-31",
-        "dl": "page",
-    }
-    if state:
-        params["location_state"] = state
-
-    request_url = CHRONAM_BASE + "?" + urllib.parse.urlencode(params, doseq=True)
-    data = _fetch_json(request_url)
+    request_url = chronam_request_url(year, query, rows=rows, ops=ops, state=state)
+    data = _prefetched_json(request_url)
+    if data is None:
+        data = _cached_fetch_json(request_url)
 
     results = data.get("results") if isinstance(data.get("results"), list) else []
     total = 0
@@ -379,6 +612,59 @@ def chronam_search_locgov(
     return {"results": results, "total": total, "request_url": request_url}
 
 
+@st.cache_resource(show_spinner=False)
+def _prefetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="chronam-prefetch")
+
+
+# How many finished prefetches stay tracked; older ones are forgotten (the disk cache has them)
+PREFETCH_MAX_TRACKED = 200
+
+
+# {url: Future} for every submitted prefetch, shared by all sessions. Reruns skip URLs that are
+# pending or done, and the foreground search reuses a prefetch instead of fetching again.
+@st.cache_resource(show_spinner=False)
+def _prefetch_futures() -> tuple[threading.Lock, Dict[str, Future]]:
+    return threading.Lock(), {}
+
+
+def _prefetched_json(url: str) -> Optional[Dict[str, Any]]:
+    # Reuses a prefetch of this URL that is running or finished; None means "fetch it yourself".
+    # One still queued behind other jobs in the shared pool is cancelled instead of waited on.
+    lock, futures = _prefetch_futures()
+    with lock:
+        fut = futures.get(url)
+        if fut is not None and not (fut.running() or fut.done()) and fut.cancel():
+            del futures[url]
+            fut = None
+    if fut is None:
+        return None
+    try:
+        return fut.result()
+    except Exception:
+        return None
+
+
+def prefetch_chronam(year: int, queries: List[str], rows: int, ops: str, state: str | None):
+    # Warm the disk cache for the other preset searches in the background (the visible search
+    # is not delayed), so switching presets is a disk read, not a loc.gov round trip.
+    # Only the disk layer is touched from worker threads; failures are simply dropped.
+    _http_session()
+    pool = _prefetch_pool()
+    lock, futures = _prefetch_futures()
+    with lock:
+        for q in queries:
+            url = chronam_request_url(year, q, rows=rows, ops=ops, state=state)
+            if url in futures or os.path.exists(_chronam_cache_path(url)):
+                continue
+            futures[url] = pool.submit(_cached_fetch_json, url)
+
+        excess = len(futures) - PREFETCH_MAX_TRACKED
+        if excess > 0:
+            for url in [u for u, f in futures.items() if f.done()][:excess]:
+                del futures[url]
+
+
 # ✅ NEW defaults: TEAM-ONLY (do NOT include "base ball" here)
 def pick_default_queries(year: int) -> List[str]:
     if year <= 1912:
@@ -405,10 +691,17 @@ def _best_public_url(item: Dict[str, Any]) -> str:
 
 
 def normalize_article_item(item: Dict[str, Any]) -> Dict[str, str]:
-    date = str(item.get("date") or "")
-    title = str(item.get("title") or "Newspaper page")
+    # loc.gov fields are almost always strings already: only coerce the odd list/number
+    date = item.get("date") or ""
+    title = item.get("title") or "Newspaper page"
+    snippet = item.get("snippet") or item.get("description") or ""
+    if not isinstance(date, str):
+        date = str(date)
+    if not isinstance(title, str):
+        title = str(title)
+    if not isinstance(snippet, str):
+        snippet = str(snippet)
     url = _best_public_url(item)
-    snippet = str(item.get("snippet") or item.get("description") or "")
 
     if len(snippet) > 420:
         snippet = snippet[:420].rstrip() + "…"
@@ -424,15 +717,19 @@ def _text_blob(item: Dict[str, Any]) -> str:
     )
 
 
-def baseball_score(item: Dict[str, Any]) -> int:
-    blob = _text_blob(item)
-    return sum(1 for t in BASEBALL_TERMS if t in blob)
+# Callers scoring one item both ways can pass the blob in, so it is lowered/concatenated once.
+# Plain `in` scans: cheaper than one alternation regex for ~20 short literal terms.
+def baseball_score(item: Dict[str, Any], blob: Optional[str] = None) -> int:
+    if blob is None:
+        blob = _text_blob(item)
+    return sum(t in blob for t in BASEBALL_TERMS)
 
 
-def team_score(item: Dict[str, Any], year: int) -> int:
-    blob = _text_blob(item)
+def team_score(item: Dict[str, Any], year: int, blob: Optional[str] = None) -> int:
+    if blob is None:
+        blob = _text_blob(item)
     team_terms = TEAM_TERMS_PRE1913 if year <= 1912 else TEAM_TERMS_POST1912
-    return sum(1 for t in team_terms if t in blob)
+    return sum(t in blob for t in team_terms)
 
 
 def display_articles_panel(year: int):
@@ -442,6 +739,11 @@ def display_articles_panel(year: int):
         st.info("Articles are enabled for **1903–1922** right now. (We’ll expand later.)")
         return
 
+    # Opt-in: until toggled on, no search widgets are built and nothing is fetched. (An
+    # st.expander would not help here; its body still runs on every rerun.)
+    if not st.toggle("Search newspaper articles", value=False, key="show_articles"):
+        return
+
     defaults = pick_default_queries(year)
     preset = st.selectbox("Preset searches", defaults, index=0)
 
@@ -474,6 +776,7 @@ def display_articles_panel(year: int):
         )
 
     state = "new york" if ny_only else None
+    prefetch_chronam(year, [q for q in defaults if q != query], rows=rows, ops=ops, state=state)
 
     with st.spinner("Searching newspaper pages…"):
         try:
@@ -501,25 +804,30 @@ def display_articles_panel(year: int):
         )
         return
 
-    # Rank best-first: team hits first, then baseball-likeness
-    scored = []
-    for it in items:
-        scored.append((team_score(it, year), baseball_score(it), it))
-    scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
+    # Rank best-first: team hits first, then baseball-likeness. Scored + normalized once per
+    # search and kept in session state, so min-hits tweaks and other reruns skip the rework.
+    search_key = (year, query, rows, ops, state)
+    cached = st.session_state.get("articles_scored")
+    if cached and cached[0] == search_key:
+        scored = cached[1]
+    else:
+        scored = []
+        for it in items:
+            blob = _text_blob(it)
+            scored.append((team_score(it, year, blob), baseball_score(it, blob), normalize_article_item(it)))
+        scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        st.session_state["articles_scored"] = (search_key, scored)
 
     # Apply local baseball filter, but never wipe everything
-    filtered = [it for t, b, it in scored if b >= int(min_hits)]
-    if filtered:
-        items = filtered
-    else:
+    articles = [a for t, b, a in scored if b >= int(min_hits)]
+    if not articles:
         st.info("Min baseball signals removed everything; showing top-ranked results instead.")
-        items = [it for _, _, it in scored[:20]]
+        articles = [a for _, _, a in scored[:20]]
 
     st.caption("Digitized newspaper pages with OCR snippets. Use the button to open the page (always clickable).")
 
     # ✅ STREAMLIT-NATIVE RENDERING: links always clickable
-    for it in items:
-        a = normalize_article_item(it)
+    for a in articles:
         date = a["date"] or "Unknown date"
         paper = a["paper"] or "Newspaper"
         url = a["url"]
@@ -545,82 +853,173 @@ def display_articles_panel(year: int):
 # UI helpers
 # -----------------------------
 def ws_rings_count(df: pd.DataFrame) -> int:
-    if df.empty or "WSWin" not in df.columns:
+    if df.empty or "WSWin_int" not in df.columns:
         return 0
-    return int((df["WSWin"] == "Y").sum())
+    return int(df["WSWin_int"].sum())
+
 
+def season_pills(ws: int, lg: int, div: int, wc: int) -> str:
+    return (
+        ("<span class='pill'>🏆 WS Champs</span>" if ws else "")
+        + ("<span class='pill'>AL Champs</span>" if lg else "")
+        + ("<span class='pill'>Div Champs</span>" if div else "")
+        + ("<span class='pill'>Wild Card</span>" if wc else "")
+    )
 
-def season_pills(row: pd.Series) -> str:
-    pills = []
-    if row.get("WSWin") == "Y":
-        pills.append("<span class='pill'>🏆 WS Champs</span>")
-    if row.get("LgWin") == "Y":
-        pills.append("<span class='pill'>AL Champs</span>")
-    if row.get("DivWin") == "Y":
-        pills.append("<span class='pill'>Div Champs</span>")
-    if row.get("WCWin") == "Y":
-        pills.append("<span class='pill'>Wild Card</span>")
-    return "".join(pills)
 
+# All 16 pill strings, indexed by the same 4-bit WC/DIV/AL/WS code as POSTSEASON_LABELS;
+# get_yankees gathers each season's pills from it once per data load.
+PILLS_HTML = np.array([season_pills(c & 1, c & 2, c & 4, c & 8) for c in range(16)], dtype=object)
 
-def safe_default_year(available_years_desc: List[int], requested: Optional[int]) -> int:
-    if not available_years_desc:
+
+def safe_default_year(available_years_desc: pd.Index, requested: Optional[int]) -> int:
+    # Takes the filtered season index (newest first): membership is a hash lookup, not a list scan
+    if available_years_desc.empty:
         return 0
     if requested is not None and requested in available_years_desc:
-        return requested
-    return available_years_desc[0]
+        return int(requested)
+    return int(available_years_desc[0])
+
+
+# Card markup as one constant %-template: per card it is a single format call.
+# Kept on one line because blank lines would end the markdown HTML block when cards are joined.
+SEASON_CARD_TMPL = (
+    "<div class='season-card' data-era='%s'>"
+    "<div style='display:flex; justify-content:space-between; align-items:flex-start; gap:10px;'>"
+    "<div><div style='font-size:1.2rem; font-weight:900;'>%d Yankees</div>"
+    "<div class='small-note'>%s</div></div>"
+    "<div style='text-align:right;'><div style='font-weight:800;'>%s</div>"
+    "<div class='small-note'>Win%% %s</div></div>"
+    "</div>"
+    "<div style='margin-top:8px;'><span class='pill'>Postseason: %s</span>%s%s</div>"
+    "</div>"
+)
+
+
+def season_card_html(
+    year: int,
+    era: dict,
+    record: Any,
+    win_pct_str: str,
+    postseason: Any,
+    pills: str,
+    flag: Optional[dict] = None,
+) -> str:
+    marker_text = ""
+    if flag:
+        marker_text = (
+            (" ✅ Read" if flag.get("is_read") else "")
+            + (" ⭐ Favorite" if flag.get("is_favorite") else "")
+            + (" 📝 Notes" if (flag.get("notes") or "").strip() else "")
+        ).strip()
+    marker_html = f"<span class='pill'>{marker_text}</span>" if marker_text else ""
+
+    return SEASON_CARD_TMPL % (
+        era["css"],
+        year,
+        era["label"],
+        record or "—",
+        win_pct_str,
+        postseason or "—",
+        pills,
+        marker_html,
+    )
 
 
 def render_season_card(row: pd.Series, flags: Optional[dict] = None):
     year = int(row["yearID"])
-    era = era_for_year(year)
-    css = f"season-card season-era-{era['css']}"
-
-    record = str(row.get("record") or "—")
-    win_pct = row.get("win_pct")
-    win_pct_str = f"{float(win_pct):.3f}" if pd.notna(win_pct) else "—"
-    postseason = str(row.get("postseason") or "—")
-
-    read_mark = ""
-    fav_mark = ""
-    notes_hint = ""
-
-    if flags:
-        f = flags.get(year) or {}
-        if f.get("is_read"):
-            read_mark = " ✅ Read"
-        if f.get("is_favorite"):
-            fav_mark = " ⭐ Favorite"
-        if (f.get("notes") or "").strip():
-            notes_hint = " 📝 Notes"
-
-    pills = season_pills(row)
-    marker_text = (read_mark + fav_mark + notes_hint).strip()
-    marker_html = f"<span class='pill'>{marker_text}</span>" if marker_text else ""
+    pills = row.get("pills") or ""
+    flag = (flags.get(year) or {}) if flags else None
+    html = season_card_html(
+        year, era_for_year(year), row.get("record"), row.get("win_pct_str"), row.get("postseason"), pills, flag
+    )
+    st.markdown(html, unsafe_allow_html=True)
 
-    st.markdown(
-        f"""
-        <div class="{css}">
-          <div style="display:flex; justify-content:space-between; align-items:flex-start; gap:10px;">
-            <div>
-              <div style="font-size:1.2rem; font-weight:900;">{year} Yankees</div>
-              <div class="small-note">{era['label']}</div>
-            </div>
-            <div style="text-align:right;">
-              <div style="font-weight:800;">{record}</div>
-              <div class="small-note">Win% {win_pct_str}</div>
-            </div>
-          </div>
-          <div style="margin-top:8px;">
-            <span class="pill">Postseason: {postseason}</span>
-            {pills}
-            {marker_html}
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
+
+# -----------------------------
+# Season Details pane
+# -----------------------------
+# A fragment: the jump selectbox, flag editor and article search only rerun this pane,
+# not the whole timeline.
+@st.fragment
+def render_season_details(
+    yank: pd.DataFrame,
+    years_filt_desc: List[int],
+    sb,
+    user_id: str,
+    use_sb: bool,
+    flags: dict[int, dict],
+):
+    st.subheader("Season Details")
+
+    # The selectbox owns the selection (main() pre-seeds a valid value under this key)
+    st.selectbox(
+        "Jump to season",
+        options=years_filt_desc,
+        format_func=lambda y: str(y),
+        key="selected_year",
     )
 
+    sel_year = int(st.session_state["selected_year"])
+    # Keep the URL shareable: it always deep-links to the season on screen
+    if st.query_params.get("year") != str(sel_year):
+        st.query_params["year"] = str(sel_year)
+    try:
+        row = yank.loc[sel_year]
+    except KeyError:
+        st.error("Selected season not found in dataset.")
+        return
+
+    render_season_card(row, flags=flags if use_sb else None)
+
+    # Flag controls
+    if use_sb:
+        f = flags.get(sel_year) or {}
+        st.markdown("#### Your Flags")
+
+        # A form so toggling the checkboxes or typing notes does not rerun anything until Save
+        with st.form(f"season_flags_{sel_year}"):
+            colA, colB = st.columns(2)
+            with colA:
+                is_read = st.checkbox("Mark as read", value=bool(f.get("is_read")), key=f"read_{sel_year}")
+            with colB:
+                is_fav = st.checkbox("Favorite", value=bool(f.get("is_favorite")), key=f"fav_{sel_year}")
+
+            notes = st.text_area(
+                "Notes",
+                value=str(f.get("notes") or ""),
+                height=110,
+                key=f"notes_{sel_year}",
+                placeholder="What stood out? Players, stories, memories…",
+            )
+            submitted = st.form_submit_button("Save")
+
+        if submitted:
+            try:
+                save_flag(sb, user_id=user_id, year=sel_year, read=is_read, fav=is_fav, notes=notes)
+                st.success("Saved.")
+                # Fragment reruns reuse this dict, so patch the saved row in place
+                # (the cached read was cleared; the next full rerun refetches it).
+                flags[sel_year] = {**f, "is_read": is_read, "is_favorite": is_fav, "notes": notes}
+            except Exception as e:
+                st.error(f"Could not save: {e}")
+
+    st.markdown("#### Season Snapshot")
+    snap = {
+        "Year": sel_year,
+        "Record": row.get("record", "—"),
+        "Win %": row.get("win_pct_str", "—"),
+        "Postseason": row.get("postseason", "—"),
+        "WSWin": row.get("WSWin", ""),
+        "LgWin": row.get("LgWin", ""),
+        "DivWin": row.get("DivWin", ""),
+        "WCWin": row.get("WCWin", ""),
+    }
+    st.write(snap)
+
+    st.divider()
+    display_articles_panel(sel_year)
+
 
 # -----------------------------
 # Main App
@@ -634,15 +1033,16 @@ def main():
 
     # Load data
     try:
-        df = load_data("Teams.csv")
+        mtime = os.path.getmtime(TEAMS_CSV)
+        yank = load_yankees(TEAMS_CSV, mtime)
     except Exception as e:
-        st.error(f"Error loading Teams.csv from repo root: {e}")
+        st.error(f"Error loading {TEAMS_CSV} from repo root: {e}")
         st.stop()
 
-    yank = get_yankees(df)
     if yank.empty:
         st.error("No Yankees seasons found (teamID='NYA'). Check your Teams.csv.")
         st.stop()
+    overview = yankees_overview(TEAMS_CSV, mtime)
 
     # Supabase sidebar
     st.sidebar.header("Persistence (optional)")
@@ -652,10 +1052,10 @@ def main():
     flags: dict[int, dict] = {}
 
     if sb is None:
-        if SUPABASE_ENABLED:
-            st.sidebar.info("Supabase library is available, but SUPABASE_URL / SUPABASE_KEY not set in secrets.")
-        else:
+        if not SUPABASE_ENABLED:
             st.sidebar.info("Supabase not installed in this environment (optional).")
+        elif not all(supabase_credentials()):
+            st.sidebar.info("Supabase library is available, but SUPABASE_URL / SUPABASE_KEY not set in secrets.")
     else:
         use_sb = st.sidebar.toggle("Enable Supabase saving", value=True)
         user_id = st.sidebar.text_input("User ID", value="andrew", help="Simple identifier for your flags/notes.")
@@ -665,13 +1065,12 @@ def main():
     st.sidebar.divider()
 
     # Sidebar filters
-    years_all = yank["yearID"].dropna().astype(int).tolist()
-    min_year, max_year = min(years_all), max(years_all)
+    min_year, max_year = overview["min_year"], overview["max_year"]
 
     st.sidebar.header("Filters")
     start_year = st.sidebar.slider("Start year", min_year, max_year, min_year)
 
-    decade_starts = sorted({(int(y) // 10) * 10 for y in years_all}) if years_all else []
+    decade_starts = overview["decades"]
     selected_decades = st.sidebar.multiselect(
         "Decades (optional)",
         options=decade_starts,
@@ -684,30 +1083,29 @@ def main():
     only_favs = st.sidebar.toggle("Favorites only", value=False) if use_sb else False
     only_read = st.sidebar.toggle("Read only", value=False) if use_sb else False
 
-    # Apply filters
-    filt = yank[yank["yearID"].astype(int) >= int(start_year)].copy()
+    # Apply filters: compose one mask over yank and slice once (no intermediate copies)
+    mask = yank["yearID"] >= int(start_year)
 
     if selected_decades:
-        filt["decade"] = (filt["yearID"].astype(int) // 10) * 10
-        filt = filt[filt["decade"].isin(selected_decades)].copy()
+        mask &= yank["decade"].isin(selected_decades)
 
-    if only_ws and "WSWin" in filt.columns:
-        filt = filt[filt["WSWin"] == "Y"].copy()
+    if only_ws:
+        mask &= yank["WSWin_int"].astype(bool)
 
     if use_sb and (only_favs or only_read):
-        keep_years = set()
-        for y, r in flags.items():
-            if only_favs and r.get("is_favorite"):
-                keep_years.add(int(y))
-            if only_read and r.get("is_read"):
-                keep_years.add(int(y))
-        filt = filt[filt["yearID"].astype(int).isin(sorted(keep_years))].copy()
+        # Years with a wanted flag (favorite OR read), matched against the season index
+        keep = {
+            y
+            for y, f in flags.items()
+            if (only_favs and f.get("is_favorite")) or (only_read and f.get("is_read"))
+        }
+        mask &= yank.index.isin(keep)
 
-    filt = filt.sort_values("yearID", ascending=False)
-    years_filt_desc = filt["yearID"].dropna().astype(int).tolist()
+    filt = yank[mask]  # yank is sorted newest-first and masking keeps that order
+    years_filt_desc = filt.index.tolist()
 
     # Ring counters
-    total_rings = ws_rings_count(yank)
+    total_rings = overview["rings"]
     filtered_rings = ws_rings_count(filt)
 
     c1, c2, c3 = st.columns([1, 1, 2])
@@ -731,12 +1129,15 @@ def main():
         st.warning("No seasons match your current filters.")
         st.stop()
 
-    # Selected year (safe)
+    # Selected year (safe). A ?year=1927 deep link picks the first season of a new session.
     if "selected_year" not in st.session_state:
-        st.session_state["selected_year"] = years_filt_desc[0]
+        try:
+            st.session_state["selected_year"] = int(st.query_params.get("year", years_filt_desc[0]))
+        except ValueError:
+            st.session_state["selected_year"] = years_filt_desc[0]
 
     st.session_state["selected_year"] = safe_default_year(
-        available_years_desc=years_filt_desc, requested=st.session_state.get("selected_year")
+        available_years_desc=filt.index, requested=st.session_state.get("selected_year")
     )
 
     # Layout: timeline + details
@@ -744,87 +1145,30 @@ def main():
 
     with left:
         st.subheader("Timeline")
+        # One markdown payload for the whole timeline instead of a message per card/header
+        show_flags = flags if use_sb else {}
+        parts = []
         last_era_key = None
-        for _, row in filt.iterrows():
-            year = int(row["yearID"])
-            era = era_for_year(year)
-
+        for year, era_idx, record, win_pct_str, post, pills in zip(
+            years_filt_desc,
+            filt["era"].to_numpy(),
+            filt["record"].to_numpy(),
+            filt["win_pct_str"].to_numpy(),
+            filt["postseason"].to_numpy(),
+            filt["pills"].to_numpy(),
+        ):
+            era = era_meta(era_idx, year)
             if era["key"] != last_era_key:
-                render_era_header(era)
+                parts.append(ERA_HEADER_HTML[era_idx] if era_idx >= 0 else era_header_html(era))
                 last_era_key = era["key"]
 
-            cols = st.columns([0.82, 0.18])
-            with cols[0]:
-                render_season_card(row, flags=flags if use_sb else None)
-            with cols[1]:
-                if st.button("View", key=f"view_{year}"):
-                    st.session_state["selected_year"] = year
-                    st.rerun()
-
-    with right:
-        st.subheader("Season Details")
-
-        sel = st.selectbox(
-            "Jump to season",
-            options=years_filt_desc,
-            index=0,
-            format_func=lambda y: str(y),
-            key="jump_selectbox",
-        )
-        if sel != st.session_state["selected_year"]:
-            st.session_state["selected_year"] = int(sel)
+            flag = show_flags.get(year)
+            parts.append(season_card_html(year, era, record, win_pct_str, post, pills, flag))
 
-        sel_year = int(st.session_state["selected_year"])
-        row_df = yank[yank["yearID"].astype(int) == sel_year]
-        if row_df.empty:
-            st.error("Selected season not found in dataset.")
-            st.stop()
-        row = row_df.iloc[0]
-
-        render_season_card(row, flags=flags if use_sb else None)
-
-        # Flag controls
-        if use_sb:
-            f = flags.get(sel_year) or {}
-            st.markdown("#### Your Flags")
-
-            colA, colB = st.columns(2)
-            with colA:
-                is_read = st.checkbox("Mark as read", value=bool(f.get("is_read")), key=f"read_{sel_year}")
-            with colB:
-                is_fav = st.checkbox("Favorite", value=bool(f.get("is_favorite")), key=f"fav_{sel_year}")
+        st.markdown("\n".join(parts), unsafe_allow_html=True)
 
-            notes = st.text_area(
-                "Notes",
-                value=str(f.get("notes") or ""),
-                height=110,
-                key=f"notes_{sel_year}",
-                placeholder="What stood out? Players, stories, memories…",
-            )
-
-            if st.button("Save", key=f"save_{sel_year}"):
-                try:
-                    save_flag(sb, user_id=user_id, year=sel_year, read=is_read, fav=is_fav, notes=notes)
-                    st.success("Saved.")
-                    flags = read_flags(sb, user_id=user_id)
-                except Exception as e:
-                    st.error(f"Could not save: {e}")
-
-        st.markdown("#### Season Snapshot")
-        snap = {
-            "Year": sel_year,
-            "Record": row.get("record", "—"),
-            "Win %": f"{float(row['win_pct']):.3f}" if pd.notna(row.get("win_pct")) else "—",
-            "Postseason": row.get("postseason", "—"),
-            "WSWin": row.get("WSWin", ""),
-            "LgWin": row.get("LgWin", ""),
-            "DivWin": row.get("DivWin", ""),
-            "WCWin": row.get("WCWin", ""),
-        }
-        st.write(snap)
-
-        st.divider()
-        display_articles_panel(sel_year)
+    with right:
+        render_season_details(yank, years_filt_desc, sb=sb, user_id=user_id, use_sb=use_sb, flags=flags)
 
 
 if __name__ == "__main__":